@@ -1,51 +1,99 @@
+import math
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from numba import njit
 from wind_generator import IWindField
 
 
-@dataclass
+def _state_field(index: int, doc: str) -> property:
+    """Property exposing one slot of BoatState's underlying array."""
+    def getter(self):
+        return self._s[index]
+
+    def setter(self, value):
+        self._s[index] = value
+
+    return property(getter, setter, doc=doc)
+
+
+def _normalize_angle(angle: float) -> float:
+    """Wraps any angle to [-pi, +pi) with a modulo, for values that may be several turns out of range."""
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
 class BoatState:
-    """State of the boat."""
-    x: float
-    y: float
-    psi: float
-    Vx: float  # Body-frame x velocity
-    Vy: float  # Body-frame y velocity
-    omega: float
-    adapt_param1: float # estimation of the forward force uncertanty
-    adapt_param2: float # estimation of the Moment force uncertanty
+    """State of the boat, stored contiguously as [x, y, psi, Vx, Vy, omega, adapt_param1, adapt_param2]."""
+    __slots__ = ("_s", "_scratch")
+
+    x = _state_field(0, "Global x position")
+    y = _state_field(1, "Global y position")
+    Vx = _state_field(3, "Body-frame x velocity")
+    Vy = _state_field(4, "Body-frame y velocity")
+    omega = _state_field(5, "Angular velocity")
+    adapt_param1 = _state_field(6, "Estimation of the forward force uncertanty")
+    adapt_param2 = _state_field(7, "Estimation of the Moment force uncertanty")
+
+    def __init__(self, x: float, y: float, psi: float, Vx: float, Vy: float, omega: float,
+                 adapt_param1: float, adapt_param2: float):
+        # psi is normalized here and in its setter, so update() only has to undo single-step overshoots
+        self._s = np.array([x, y, _normalize_angle(psi), Vx, Vy, omega, adapt_param1, adapt_param2],
+                           dtype=np.float64)
+        self._scratch = np.empty(8, dtype=np.float64)  # derivatives * dt, reused by update
+
+    @property
+    def psi(self):
+        """Heading angle in [-pi, +pi]"""
+        return self._s[2]
+
+    @psi.setter
+    def psi(self, value):
+        self._s[2] = _normalize_angle(value)
+
+    def __repr__(self) -> str:
+        fields = ("x", "y", "psi", "Vx", "Vy", "omega", "adapt_param1", "adapt_param2")
+        return f"BoatState({', '.join(f'{name}={value}' for name, value in zip(fields, self._s))})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return bool(np.array_equal(self._s, other._s))
+
+    def __copy__(self) -> 'BoatState':
+        copied = self.__class__.__new__(self.__class__)
+        copied._s = self._s.copy()  # own array, so the copy does not alias this state
+        copied._scratch = np.empty(8, dtype=np.float64)
+        return copied
+
+    def __deepcopy__(self, memo: dict) -> 'BoatState':
+        return self.__copy__()
 
     @classmethod
     def from_array(cls, arr: np.ndarray) -> 'BoatState':
         """Creates a BoatState object from a numpy array."""
-        if len(arr) != 8:
-            raise ValueError("Array must have exactly 8 elements.")
+        assert len(arr) == 8, "Array must have exactly 8 elements."  # debug-only, stripped by python -O
         return cls(arr[0], arr[1], arr[2], arr[3], arr[4], arr[5], arr[6], arr[7])
 
     def to_array(self) -> np.ndarray:
         """Converts the boat state to a numpy array."""
-        return np.array([self.x, self.y, self.psi, self.Vx, self.Vy, self.omega, self.adapt_param1, self.adapt_param2])
+        return self._s.copy()
 
     def _wrap_angle(self, angle):
-        """Wraps angle to [-pi, +pi] using atan2-style wrapping."""
-        return (angle + np.pi) % (2 * np.pi) - np.pi
+        """Wraps angle to [-pi, +pi] after one Euler step, which never moves an in-range heading by a full turn."""
+        if angle > math.pi:
+            return angle - 2 * math.pi
+        if angle < -math.pi:
+            return angle + 2 * math.pi
+        return angle
 
     def update(self, derivatives: np.ndarray, dt: float) -> None:
         """Updates the boat state using Euler integration."""
-        if len(derivatives) != 8:
-            raise ValueError("Derivatives must have exactly 8 elements.")
-        self.x += derivatives[0] * dt
-        self.y += derivatives[1] * dt
-        self.psi += derivatives[2] * dt
-        self.psi = self._wrap_angle(self.psi)
-        self.Vx += derivatives[3] * dt
-        self.Vy += derivatives[4] * dt
-        self.omega += derivatives[5] * dt
-        self.adapt_param1 += derivatives[6] * dt
-        self.adapt_param2 += derivatives[7] * dt
-
-
-@dataclass
+        assert len(derivatives) == 8, "Derivatives must have exactly 8 elements."  # debug-only, stripped by python -O
+        np.multiply(derivatives, dt, out=self._scratch)
+        np.add(self._s, self._scratch, out=self._s)
+        self._s[2] = self._wrap_angle(self._s[2])
+
+
+@dataclass(slots=True, frozen=True)
 class BoatParameters:
     """Parameters of the boat."""
     mass: float
@@ -57,9 +105,127 @@ class BoatParameters:
     sail_Cy: float # Sway drag coefficient
     sail_area: float # m² (example sail area)
 
+    # Derived invariants, computed once at init; the class is frozen so they cannot go stale
+    # (use dataclasses.replace to change a parameter)
+    inv_mass: float = field(init=False, repr=False)
+    inv_inertia: float = field(init=False, repr=False)
+    wind_coef_x: float = field(init=False, repr=False) # 0.5 * rho * A * Cx
+    wind_coef_y: float = field(init=False, repr=False) # 0.5 * rho * A * Cy
+
+    def __post_init__(self):
+        object.__setattr__(self, "inv_mass", 1.0 / self.mass)
+        object.__setattr__(self, "inv_inertia", 1.0 / self.inertia)
+        wind_force = 0.5 * self.air_density * self.sail_area
+        object.__setattr__(self, "wind_coef_x", wind_force * self.sail_Cx)
+        object.__setattr__(self, "wind_coef_y", wind_force * self.sail_Cy)
+
+
+@njit(cache=True, fastmath=True)
+def _kin_core(x, y, psi, Vx, Vy, omega,
+              Fx, Fy, M,
+              inv_mass, inv_inertia, Dx, Dy, Dpsi,
+              wind_coef_x, wind_coef_y,
+              Vwx, Vwy):
+    """
+    Jitted kinematics of the vessel with wind sail forces.
+    Wind (Vwx, Vwy) is given in global frame; zero wind coefficients disable the sail.
+
+    Returns:
+        tuple: Derivative of the vessel's state (dx, dy, dpsi, dVx, dVy, domega).
+    """
+    cos_psi = math.cos(psi)  # computed once, LLVM fuses the pair into sincos
+    sin_psi = math.sin(psi)
+
+    # Kinematics
+    dx = Vx * cos_psi - Vy * sin_psi
+    dy = Vx * sin_psi + Vy * cos_psi
+    dpsi = omega
+
+    # Transform wind to boat's body frame
+    V_wx_body = cos_psi * Vwx + sin_psi * Vwy
+    V_wy_body = -sin_psi * Vwx + cos_psi * Vwy
+
+    # Calculate apparent wind angle and speed difference
+    V_aw_x = V_wx_body - Vx
+    V_aw_y = V_wy_body - Vy
+
+    # Calculate sail forces
+    F_sail_x = wind_coef_x * V_aw_x
+    F_sail_y = wind_coef_y * V_aw_y
+
+    # Dynamics with sail forces
+    dVx = ((Fx + F_sail_x) * inv_mass) - Dx * Vx
+    dVy = ((Fy + F_sail_y) * inv_mass) - Dy * Vy
+    domega = (M * inv_inertia) - Dpsi * omega
+    return dx, dy, dpsi, dVx, dVy, domega
+
+
+@njit(cache=True, fastmath=True)
+def _differential_forces(left, right, L):
+    """Two fixed thrusters (left/right), returns (Fx, Fy, M)."""
+    Fx = left + right  # Sum of thrusts
+    Fy = 0.0  # No lateral force
+    M = L * (right - left)  # Differential torque
+    return Fx, Fy, M
+
+
+@njit(cache=True, fastmath=True)
+def _steerable_forces(thrust, theta, L):
+    """Single steerable thruster, returns (Fx, Fy, M)."""
+    sin_theta = math.sin(theta)
+    Fx = thrust * math.cos(theta)
+    Fy = thrust * sin_theta
+    M = thrust * L * sin_theta  # Torque from offset
+    return Fx, Fy, M
+
+
+def _make_step(thrust_forces):
+    """
+    Builds a jitted Euler step for one boat type, fusing its thruster model, the kinematics,
+    the integration and the heading wrap into a single call. The state array is updated in place.
+    """
+    @njit(cache=True, fastmath=True)
+    def step(s, c0, c1, adapt0, adapt1,
+             L, inv_mass, inv_inertia, Dx, Dy, Dpsi, wind_coef_x, wind_coef_y,
+             Vwx, Vwy, dt):
+        Fx, Fy, M = thrust_forces(c0, c1, L)
+        dx, dy, dpsi, dVx, dVy, domega = _kin_core(
+            s[0], s[1], s[2], s[3], s[4], s[5], Fx, Fy, M,
+            inv_mass, inv_inertia, Dx, Dy, Dpsi, wind_coef_x, wind_coef_y, Vwx, Vwy)
+        s[0] += dx * dt
+        s[1] += dy * dt
+        psi = s[2] + dpsi * dt
+        if psi > math.pi:
+            psi -= 2 * math.pi
+        elif psi < -math.pi:
+            psi += 2 * math.pi
+        s[2] = psi
+        s[3] += dVx * dt
+        s[4] += dVy * dt
+        s[5] += domega * dt
+        s[6] += adapt0 * dt
+        s[7] += adapt1 * dt
+    return step
+
+
+# Warm up the jit cache at import so the first simulation step does not pay for compilation
+_kin_core(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
 
 class Boat:
     """Base class for boat dynamics with thrusters."""
+    # Subclasses set a jitted thruster model (c0, c1, L) -> (Fx, Fy, M); a fused step is generated from it
+    # unless some class in the hierarchy overrides dynamics(), which the fused step would bypass
+    _thrust_forces = None
+    _step = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.dynamics is not Boat.dynamics:
+            cls._step = None
+        elif cls.__dict__.get("_thrust_forces") is not None:
+            cls._step = staticmethod(_make_step(cls._thrust_forces))
+
     def __init__(self, init_state: BoatState, params: BoatParameters, wind_field: IWindField):
         """
         Initializes the Boat object with initial conditions and system parameters.
@@ -72,6 +238,7 @@ class Boat:
         self.state: BoatState = init_state
         self.params: BoatParameters = params
         self.wind_field: IWindField = wind_field  # Wind in global frame [Vw_x, Vw_y]
+        self._deriv8 = np.empty(8, dtype=np.float64)  # [state derivatives, adaptation derivatives], reused every step
 
     def dynamics(self, control: np.ndarray) -> np.ndarray:
         """
@@ -80,7 +247,16 @@ class Boat:
         Returns:
             np.ndarray: Derivative of the vessel's state [dx, dy, dpsi, dVx, dVy, domega].
         """
-        raise NotImplementedError("Dynamics method not implemented.")
+        if self._thrust_forces is None:
+            raise NotImplementedError("Dynamics method not implemented.")
+        return self._kinematics(*self._thrust_forces(control[0], control[1], self.params.L))
+
+    def _wind(self, x: float, y: float) -> tuple:
+        """Returns global wind (Vw_x, Vw_y) and the sail coefficients, zero coefficients disable sail forces."""
+        if self.wind_field is None:
+            return 0.0, 0.0, 0.0, 0.0
+        V_wx_global, V_wy_global = self.wind_field.get_wind((x, y))
+        return V_wx_global, V_wy_global, self.params.wind_coef_x, self.params.wind_coef_y
 
     def _kinematics(self, Fx: float, Fy: float, M: float) -> np.ndarray:
         """
@@ -89,11 +265,114 @@ class Boat:
 
         Returns:
             np.ndarray: Derivative of the vessel's state [dx, dy, dpsi, dVx, dVy, domega].
+                        View into the preallocated buffer, overwritten on the next call.
         """
+        p = self.params
+        x, y, psi, Vx, Vy, omega = self.state._s[0:6].tolist()  # Python floats: np.float64 unboxes slowly in numba
+
+        # Get global wind velocity (wind field stays in Python)
+        V_wx_global, V_wy_global, wind_coef_x, wind_coef_y = self._wind(x, y)
+
+        self._deriv8[0:6] = _kin_core(
+            x, y, psi, Vx, Vy, omega,
+            Fx, Fy, M,
+            p.inv_mass, p.inv_inertia, p.damping[0], p.damping[1], p.damping[2],
+            wind_coef_x, wind_coef_y,
+            V_wx_global, V_wy_global,
+        )
+        return self._deriv8[0:6]
+
+    def update_state(self, control: np.ndarray, adaptation_derivatives: np.ndarray, dt: float) -> None:
+        """Updates state using Euler integration."""
+        if self._step is None:
+            # Custom dynamics() or no jitted thruster model
+            self.dynamics(control)  # fills self._deriv8[0:6]
+            self._deriv8[6:8] = adaptation_derivatives
+            self.state.update(self._deriv8, dt)
+            return
+
+        s, p = self.state._s, self.params
+        V_wx_global, V_wy_global, wind_coef_x, wind_coef_y = self._wind(s[0], s[1])
+        self._step(s, float(control[0]), float(control[1]),
+                   float(adaptation_derivatives[0]), float(adaptation_derivatives[1]),
+                   p.L, p.inv_mass, p.inv_inertia, p.damping[0], p.damping[1], p.damping[2],
+                   wind_coef_x, wind_coef_y, V_wx_global, V_wy_global, dt)
+
+
+class DifferentialThrustBoat(Boat):
+    """Boat with two fixed thrusters (left/right)."""
+    _thrust_forces = staticmethod(_differential_forces)
+
+
+class SteerableThrustBoat(Boat):
+    """Boat with a single steerable thruster."""
+    _thrust_forces = staticmethod(_steerable_forces)
+
+
+class BoatFleet:
+    """
+    Base class for a batch of boats of the same type simulated together.
+    The state is stored structure-of-arrays: one contiguous row of length N per state component.
+    """
+    def __init__(self, init_states: np.ndarray, params: BoatParameters, wind_field: IWindField, dtype=np.float32):
+        """
+        Initializes the fleet with initial conditions and shared system parameters.
+
+        Args:
+            init_states: Initial states of the boats, shape (N, 8)
+            params: Boat parameters shared by all boats
+            wind_field: Class to get wind vector field [Vx_wind, Vy_wind]
+            dtype: State precision; float32 halves memory traffic for large fleets,
+                   use np.float64 to reproduce single-boat results exactly
+        """
+        self._s = np.array(init_states, dtype=dtype).reshape(-1, 8).T.copy()  # (8, N)
+        self.num_boats = self._s.shape[1]
+        self.params: BoatParameters = params
+        self.wind_field: IWindField = wind_field  # Wind in global frame [Vw_x, Vw_y]
+        self._deriv = np.empty_like(self._s)  # [state derivatives, adaptation derivatives], reused every step
+
+        # Row views into the state array, shape (N,)
+        (self.x, self.y, self.psi, self.Vx, self.Vy, self.omega,
+         self.adapt_param1, self.adapt_param2) = self._s
+
+    @classmethod
+    def from_states(cls, states: list, params: BoatParameters, wind_field: IWindField, dtype=np.float32) -> 'BoatFleet':
+        """Creates a fleet from a list of BoatState objects."""
+        return cls(np.array([state.to_array() for state in states]), params, wind_field, dtype)
+
+    def to_array(self) -> np.ndarray:
+        """Returns the states of all boats, shape (N, 8)."""
+        return self._s.T.copy()
+
+    def dynamics_batch(self, controls: np.ndarray) -> np.ndarray:
+        """
+        Computes the dynamics of all vessels based on their control inputs.
+
+        Args:
+            controls: Control inputs, shape (N, 2)
+
+        Returns:
+            np.ndarray: Derivatives [dx, dy, dpsi, dVx, dVy, domega], shape (6, N).
+        """
+        raise NotImplementedError("Dynamics method not implemented.")
+
+    def _kinematics_batch(self, Fx: np.ndarray, Fy: np.ndarray, M: np.ndarray) -> np.ndarray:
+        """
+        Vectorized kinematics of the fleet based on forces and moments,
+        including wind sail dynamics.
+
+        Returns:
+            np.ndarray: Derivatives [dx, dy, dpsi, dVx, dVy, domega], shape (6, N).
+                        View into the preallocated buffer, overwritten on the next call.
+        """
+        p, d = self.params, self._deriv
+        cos_psi = np.cos(self.psi)
+        sin_psi = np.sin(self.psi)
+
         # Kinematics
-        dx = self.state.Vx * np.cos(self.state.psi) - self.state.Vy * np.sin(self.state.psi)
-        dy = self.state.Vx * np.sin(self.state.psi) + self.state.Vy * np.cos(self.state.psi)
-        dpsi = self.state.omega
+        d[0] = self.Vx * cos_psi - self.Vy * sin_psi
+        d[1] = self.Vx * sin_psi + self.Vy * cos_psi
+        d[2] = self.omega
 
         # Initialize sail forces
         F_sail_x, F_sail_y = 0.0, 0.0
@@ -101,47 +380,54 @@ class Boat:
         # Calculate wind effects if wind field exists
         if self.wind_field is not None:
             # Get global wind velocity
-            V_wx_global, V_wy_global = self.wind_field.get_wind([self.state.x, self.state.y])
-            
-            # Transform to boat's body frame
-            V_wx_body = np.cos(self.state.psi) * V_wx_global + np.sin(self.state.psi) * V_wy_global
-            V_wy_body = -np.sin(self.state.psi) * V_wx_global + np.cos(self.state.psi) * V_wy_global
-            
-            # Calculate apparent wind angle and speed difference
-            V_aw_x = V_wx_body - self.state.Vx
-            V_aw_y = V_wy_body - self.state.Vy
-            
+            V_w_global = self.wind_field.get_wind_batch(self._s[0:2].T).astype(self._s.dtype, copy=False)
+            V_wx_global, V_wy_global = V_w_global[:, 0], V_w_global[:, 1]
+
+            # Apparent wind in boats' body frame: rotate by -psi elementwise,
+            # no (N, 2, 2) rotation matrices or einsum needed
+            V_aw_x = cos_psi * V_wx_global + sin_psi * V_wy_global - self.Vx
+            V_aw_y = cos_psi * V_wy_global - sin_psi * V_wx_global - self.Vy
+
             # Calculate sail forces (using boat parameters)
-            Wind_Force = 0.5 * self.params.air_density * self.params.sail_area
-            F_sail_x = Wind_Force * self.params.sail_Cx * V_aw_x
-            F_sail_y = Wind_Force * self.params.sail_Cy * V_aw_y
+            F_sail_x = p.wind_coef_x * V_aw_x
+            F_sail_y = p.wind_coef_y * V_aw_y
 
         # Dynamics with sail forces
-        dVx = ((Fx + F_sail_x) / self.params.mass) - self.params.damping[0] * self.state.Vx
-        dVy = ((Fy + F_sail_y) / self.params.mass) - self.params.damping[1] * self.state.Vy
-        domega = (M / self.params.inertia) - self.params.damping[2] * self.state.omega
-        return np.array([dx, dy, dpsi, dVx, dVy, domega])
+        d[3] = ((Fx + F_sail_x) * p.inv_mass) - p.damping[0] * self.Vx
+        d[4] = ((Fy + F_sail_y) * p.inv_mass) - p.damping[1] * self.Vy
+        d[5] = (M * p.inv_inertia) - p.damping[2] * self.omega
+        return d[0:6]
 
-    def update_state(self, control: np.ndarray, adaptation_derivatives: np.ndarray, dt: float) -> None:
-        """Updates state using Euler integration."""
-        derivatives = np.concatenate([self.dynamics(control), adaptation_derivatives])
-        self.state.update(derivatives, dt)
+    def update_state(self, controls: np.ndarray, adaptation_derivatives: np.ndarray, dt: float) -> None:
+        """
+        Updates the states of all boats using Euler integration.
 
+        Args:
+            controls: Control inputs, shape (N, 2)
+            adaptation_derivatives: Adaptation parameter derivatives, shape (N, 2)
+            dt: Time step
+        """
+        self.dynamics_batch(np.asarray(controls, dtype=self._s.dtype))  # fills self._deriv[0:6]
+        self._deriv[6:8] = np.asarray(adaptation_derivatives).T
+        self._s += self._deriv * dt
+        self.psi[:] = (self.psi + np.pi) % (2 * np.pi) - np.pi
 
-class DifferentialThrustBoat(Boat):
-    """Boat with two fixed thrusters (left/right)."""
-    def dynamics(self, control: np.ndarray) -> np.ndarray:
-        Fx = control[0] + control[1]  # Sum of thrusts
-        Fy = 0  # No lateral force
-        M = self.params.L * (control[1] - control[0])  # Differential torque
-        return self._kinematics(Fx, Fy, M)
 
+class DifferentialThrustFleet(BoatFleet):
+    """Fleet of boats with two fixed thrusters (left/right)."""
+    def dynamics_batch(self, controls: np.ndarray) -> np.ndarray:
+        Fx = controls[:, 0] + controls[:, 1]  # Sum of thrusts
+        Fy = 0.0  # No lateral force
+        M = self.params.L * (controls[:, 1] - controls[:, 0])  # Differential torque
+        return self._kinematics_batch(Fx, Fy, M)
 
-class SteerableThrustBoat(Boat):
-    """Boat with a single steerable thruster."""
-    def dynamics(self, control: np.ndarray) -> np.ndarray:
-        thrust, theta = control[0], control[1]
+
+class SteerableThrustFleet(BoatFleet):
+    """Fleet of boats with a single steerable thruster."""
+    def dynamics_batch(self, controls: np.ndarray) -> np.ndarray:
+        thrust, theta = controls[:, 0], controls[:, 1]
+        sin_theta = np.sin(theta)
         Fx = thrust * np.cos(theta)
-        Fy = thrust * np.sin(theta)
-        M = thrust * self.params.L * np.sin(theta)  # Torque from offset
-        return self._kinematics(Fx, Fy, M)
\ No newline at end of file
+        Fy = thrust * sin_theta
+        M = thrust * self.params.L * sin_theta  # Torque from offset
+        return self._kinematics_batch(Fx, Fy, M)
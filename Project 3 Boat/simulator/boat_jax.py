@@ -0,0 +1,140 @@
+"""
+JAX port of the boat dynamics for jit-compiled, vmapped rollouts (CPU/GPU/TPU).
+
+State layout matches BoatState.to_array(): [x, y, psi, Vx, Vy, omega, adapt_param1, adapt_param2].
+The adaptation parameters are carried through unchanged, since the controllers stay in Python.
+JAX computes in float32 unless `jax.config.update("jax_enable_x64", True)` is set.
+"""
+from typing import Callable, NamedTuple, Optional
+import jax
+import jax.numpy as jnp
+from boat import BoatParameters
+
+
+class BoatParams(NamedTuple):
+    """Boat parameters as a JAX pytree."""
+    mass: float
+    inertia: float
+    Dx: float
+    Dy: float
+    Dpsi: float
+    L: float
+    air_density: float
+    sail_Cx: float
+    sail_Cy: float
+    sail_area: float
+
+    @classmethod
+    def from_boat_parameters(cls, p: BoatParameters) -> 'BoatParams':
+        return cls(p.mass, p.inertia, p.damping[0], p.damping[1], p.damping[2], p.L,
+                   p.air_density, p.sail_Cx, p.sail_Cy, p.sail_area)
+
+
+# Thruster models: control -> (Fx, Fy, M)
+def differential_forces(control: jnp.ndarray, L: float) -> tuple:
+    """Boat with two fixed thrusters (left/right)."""
+    Fx = control[0] + control[1]  # Sum of thrusts
+    M = L * (control[1] - control[0])  # Differential torque
+    return Fx, 0.0, M
+
+
+def steerable_forces(control: jnp.ndarray, L: float) -> tuple:
+    """Boat with a single steerable thruster."""
+    thrust, theta = control[0], control[1]
+    sin_theta = jnp.sin(theta)
+    return thrust * jnp.cos(theta), thrust * sin_theta, thrust * L * sin_theta
+
+
+# Traceable wind fields: position [x, y] -> global wind [Vw_x, Vw_y]
+def constant_wind(speed: float, direction: float) -> Callable:
+    """JAX counterpart of wind_generator.ConstantWind."""
+    rad = jnp.deg2rad(direction)
+    vector = jnp.array([speed * jnp.cos(rad), speed * jnp.sin(rad)])
+    return lambda coords: vector
+
+
+def cosine_wave_wind(base_speed: float, direction: float, wavelength: float = 20.0, amplitude: float = 0.5) -> Callable:
+    """JAX counterpart of wind_generator.CosineWaveWind."""
+    rad = jnp.deg2rad(direction)
+    dir_vector = jnp.array([jnp.cos(rad), jnp.sin(rad)])
+
+    def wind(coords):
+        perp_distance = jnp.dot(coords, dir_vector)
+        speed_mod = 1 + amplitude * jnp.cos(2 * jnp.pi * perp_distance / wavelength)
+        return base_speed * speed_mod * dir_vector
+    return wind
+
+
+def kinematics(state: jnp.ndarray, Fx, Fy, M, params: BoatParams, wind_fn: Optional[Callable] = None) -> jnp.ndarray:
+    """
+    Computes the kinematics of the vessel based on forces and moments,
+    including wind sail dynamics.
+
+    Returns:
+        jnp.ndarray: Derivative of the vessel's state [dx, dy, dpsi, dVx, dVy, domega].
+    """
+    p = params
+    psi, Vx, Vy, omega = state[2], state[3], state[4], state[5]
+    cos_psi, sin_psi = jnp.cos(psi), jnp.sin(psi)
+
+    # Kinematics
+    dx = Vx * cos_psi - Vy * sin_psi
+    dy = Vx * sin_psi + Vy * cos_psi
+
+    # Initialize sail forces
+    F_sail_x, F_sail_y = 0.0, 0.0
+
+    # Calculate wind effects if wind field exists (resolved at trace time)
+    if wind_fn is not None:
+        V_w_global = wind_fn(state[0:2])
+        V_aw_x = cos_psi * V_w_global[0] + sin_psi * V_w_global[1] - Vx
+        V_aw_y = -sin_psi * V_w_global[0] + cos_psi * V_w_global[1] - Vy
+        Wind_Force = 0.5 * p.air_density * p.sail_area
+        F_sail_x = Wind_Force * p.sail_Cx * V_aw_x
+        F_sail_y = Wind_Force * p.sail_Cy * V_aw_y
+
+    # Dynamics with sail forces
+    dVx = ((Fx + F_sail_x) / p.mass) - p.Dx * Vx
+    dVy = ((Fy + F_sail_y) / p.mass) - p.Dy * Vy
+    domega = (M / p.inertia) - p.Dpsi * omega
+    return jnp.stack([dx, dy, omega, dVx, dVy, domega])
+
+
+def make_step(forces_fn: Callable = differential_forces, wind_fn: Optional[Callable] = None) -> Callable:
+    """
+    Builds a jitted Euler step `step(state, control, params, dt) -> new_state` for one boat type.
+
+    Args:
+        forces_fn: Thruster model, e.g. differential_forces or steerable_forces
+        wind_fn: Traceable wind field, e.g. constant_wind(...); None disables wind
+    """
+    @jax.jit
+    def step(state, control, params, dt):
+        Fx, Fy, M = forces_fn(control, params.L)
+        new_state = state[:6] + kinematics(state, Fx, Fy, M, params, wind_fn) * dt
+        new_state = new_state.at[2].set((new_state[2] + jnp.pi) % (2 * jnp.pi) - jnp.pi)
+        return state.at[:6].set(new_state)
+    return step
+
+
+def make_rollout(step: Callable) -> Callable:
+    """
+    Builds a jitted batched rollout `rollout(states, controls, params, dt) -> trajectory`.
+
+    Args (of the returned function):
+        states: Initial states, shape (N, 8)
+        controls: Open-loop controls, shape (T, N, 2)
+
+    Returns (of the returned function):
+        Trajectory of states after each step, shape (T, N, 8)
+    """
+    step_batch = jax.vmap(step, in_axes=(0, 0, None, None))
+
+    @jax.jit
+    def rollout(states, controls, params, dt):
+        def body(carry, control):
+            new_states = step_batch(carry, control, params, dt)
+            return new_states, new_states
+        _, trajectory = jax.lax.scan(body, states, controls)
+        return trajectory
+    return rollout
@@ -0,0 +1,132 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython version of the boat step functions, for deployments without numba's import and compile cost.
+
+Build in place with:
+    python setup_boat_step.py build_ext --inplace
+
+`kinematics` has the same signature as boat._kin_core. The wind is sampled in Python beforehand,
+so the C core and the GIL-free dynamics do not call back into the wind field.
+"""
+import numpy as np
+from libc.math cimport sin, cos
+
+ctypedef struct BoatParamsC:
+    double inv_mass
+    double inv_inertia
+    double Dx
+    double Dy
+    double Dpsi
+    double wind_coef_x
+    double wind_coef_y
+    double L
+
+
+cdef inline void kinematics_c(double x, double y, double psi, double Vx, double Vy, double omega,
+                              double Fx, double Fy, double M,
+                              const BoatParamsC* p, double Vwx, double Vwy, double* out) noexcept nogil:
+    """Writes [dx, dy, dpsi, dVx, dVy, domega] into out."""
+    cdef double cos_psi = cos(psi)
+    cdef double sin_psi = sin(psi)
+
+    # Apparent wind in body frame
+    cdef double V_aw_x = cos_psi * Vwx + sin_psi * Vwy - Vx
+    cdef double V_aw_y = -sin_psi * Vwx + cos_psi * Vwy - Vy
+
+    out[0] = Vx * cos_psi - Vy * sin_psi
+    out[1] = Vx * sin_psi + Vy * cos_psi
+    out[2] = omega
+    out[3] = (Fx + p.wind_coef_x * V_aw_x) * p.inv_mass - p.Dx * Vx
+    out[4] = (Fy + p.wind_coef_y * V_aw_y) * p.inv_mass - p.Dy * Vy
+    out[5] = M * p.inv_inertia - p.Dpsi * omega
+
+
+cdef inline void differential_dynamics_c(const double* s, double c0, double c1,
+                                         const BoatParamsC* p, double Vwx, double Vwy, double* out) noexcept nogil:
+    """Boat with two fixed thrusters (left/right)."""
+    kinematics_c(s[0], s[1], s[2], s[3], s[4], s[5], c0 + c1, 0.0, p.L * (c1 - c0), p, Vwx, Vwy, out)
+
+
+cdef inline void steerable_dynamics_c(const double* s, double thrust, double theta,
+                                      const BoatParamsC* p, double Vwx, double Vwy, double* out) noexcept nogil:
+    """Boat with a single steerable thruster."""
+    cdef double sin_theta = sin(theta)
+    kinematics_c(s[0], s[1], s[2], s[3], s[4], s[5],
+                 thrust * cos(theta), thrust * sin_theta, thrust * p.L * sin_theta, p, Vwx, Vwy, out)
+
+
+cdef BoatParamsC _params_c(params, bint has_wind):
+    cdef BoatParamsC p
+    p.inv_mass = params.inv_mass
+    p.inv_inertia = params.inv_inertia
+    p.Dx = params.damping[0]
+    p.Dy = params.damping[1]
+    p.Dpsi = params.damping[2]
+    p.wind_coef_x = params.wind_coef_x if has_wind else 0.0  # zero coefficients disable sail forces
+    p.wind_coef_y = params.wind_coef_y if has_wind else 0.0
+    p.L = params.L
+    return p
+
+
+def kinematics(double x, double y, double psi, double Vx, double Vy, double omega,
+               double Fx, double Fy, double M,
+               double inv_mass, double inv_inertia, double Dx, double Dy, double Dpsi,
+               double wind_coef_x, double wind_coef_y,
+               double Vwx, double Vwy):
+    """Drop-in replacement for boat._kin_core, returns (dx, dy, dpsi, dVx, dVy, domega)."""
+    cdef BoatParamsC p
+    cdef double out[6]
+    p.inv_mass, p.inv_inertia = inv_mass, inv_inertia
+    p.Dx, p.Dy, p.Dpsi = Dx, Dy, Dpsi
+    p.wind_coef_x, p.wind_coef_y = wind_coef_x, wind_coef_y
+    p.L = 0.0
+    kinematics_c(x, y, psi, Vx, Vy, omega, Fx, Fy, M, &p, Vwx, Vwy, out)
+    return out[0], out[1], out[2], out[3], out[4], out[5]
+
+
+def differential_dynamics(state, control, params, wind=None, out=None):
+    """
+    Derivatives [dx, dy, dpsi, dVx, dVy, domega] of a DifferentialThrustBoat.
+
+    Args:
+        state: BoatState.to_array(), shape (8,)
+        control: [left thrust, right thrust]
+        params: BoatParameters
+        wind: global wind (Vw_x, Vw_y) at the boat, None disables sail forces
+        out: optional preallocated buffer of shape (6,)
+    """
+    if out is None:
+        out = np.empty(6)
+    cdef double[::1] s = state, o = out
+    cdef double c0 = control[0], c1 = control[1]
+    cdef BoatParamsC p = _params_c(params, wind is not None)
+    cdef double Vwx = 0.0, Vwy = 0.0
+    if wind is not None:
+        Vwx, Vwy = wind
+    with nogil:
+        differential_dynamics_c(&s[0], c0, c1, &p, Vwx, Vwy, &o[0])
+    return out
+
+
+def steerable_dynamics(state, control, params, wind=None, out=None):
+    """
+    Derivatives [dx, dy, dpsi, dVx, dVy, domega] of a SteerableThrustBoat.
+
+    Args:
+        state: BoatState.to_array(), shape (8,)
+        control: [thrust, thruster angle]
+        params: BoatParameters
+        wind: global wind (Vw_x, Vw_y) at the boat, None disables sail forces
+        out: optional preallocated buffer of shape (6,)
+    """
+    if out is None:
+        out = np.empty(6)
+    cdef double[::1] s = state, o = out
+    cdef double c0 = control[0], c1 = control[1]
+    cdef BoatParamsC p = _params_c(params, wind is not None)
+    cdef double Vwx = 0.0, Vwy = 0.0
+    if wind is not None:
+        Vwx, Vwy = wind
+    with nogil:
+        steerable_dynamics_c(&s[0], c0, c1, &p, Vwx, Vwy, &o[0])
+    return out
@@ -0,0 +1,8 @@
+"""Builds the optional Cython boat step module: python setup_boat_step.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="boat_step",
+    ext_modules=cythonize("boat_step.pyx", language_level=3, annotate=True),
+)
@@ -0,0 +1,132 @@
+import os
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+import traceback
+import numpy as np
+from boat import BoatState
+
+
+def _worker(conn, shm_name: str, num_boats: int, boats: list, indices: list) -> None:
+    """Steps a chunk of boats in a child process, reading inputs and writing states through shared memory."""
+    shm = SharedMemory(name=shm_name)
+    states, controls, adaptation = VectorizedBoatSim._views(shm, num_boats)
+    try:
+        while True:
+            cmd, dt = conn.recv()
+            if cmd == "step":
+                for boat, i in zip(boats, indices):
+                    boat.update_state(controls[i], adaptation[i], dt)
+                    states[i] = boat.state.to_array()
+            elif cmd == "reset":
+                for boat, i in zip(boats, indices):
+                    boat.state = BoatState.from_array(states[i])
+            elif cmd == "close":
+                break
+            conn.send(None)
+    except Exception:
+        conn.send(traceback.format_exc())
+    finally:
+        del states, controls, adaptation
+        shm.close()
+        conn.close()
+
+
+class VectorizedBoatSim:
+    """
+    SubprocVecEnv-style wrapper that steps independent Boat objects in worker processes.
+    Useful when the wind field or the boat model cannot be vectorized like BoatFleet.
+
+    States (N, 8), controls (N, 2) and adaptation derivatives (N, 2) live in one shared memory block;
+    every step the main process writes the inputs, signals all workers and waits for them (barrier).
+    """
+    def __init__(self, boats: list, num_workers: int = None, context: str = None):
+        """
+        Args:
+            boats: Boat objects to simulate, each is owned by one worker process
+            num_workers: Number of processes, defaults to the number of CPU cores
+            context: multiprocessing start method ('fork', 'spawn', ...), None for the platform default
+        """
+        self.num_boats = len(boats)
+        num_workers = min(num_workers or os.cpu_count() or 1, self.num_boats)
+
+        self._shm = SharedMemory(create=True, size=self.num_boats * 12 * np.dtype(np.float64).itemsize)
+        self._states, self._controls, self._adaptation = self._views(self._shm, self.num_boats)
+        self._states[:] = [boat.state.to_array() for boat in boats]
+
+        ctx = mp.get_context(context)
+        self._conns, self._procs = [], []
+        for indices in np.array_split(np.arange(self.num_boats), num_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(
+                target=_worker,
+                args=(child_conn, self._shm.name, self.num_boats, [boats[i] for i in indices], indices.tolist()),
+                daemon=True,
+            )
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+        self._closed = False
+
+    @staticmethod
+    def _views(shm: SharedMemory, num_boats: int) -> tuple:
+        """Splits the shared block into (states, controls, adaptation derivatives) arrays."""
+        buf = np.ndarray((num_boats, 12), dtype=np.float64, buffer=shm.buf)
+        return buf[:, 0:8], buf[:, 8:10], buf[:, 10:12]
+
+    def _broadcast(self, cmd: str, dt: float = 0.0) -> None:
+        for conn in self._conns:
+            conn.send((cmd, dt))
+        errors = [error for error in (conn.recv() for conn in self._conns) if error is not None]
+        if errors:
+            raise RuntimeError(f"Boat worker failed:\n{errors[0]}")
+
+    @property
+    def states(self) -> np.ndarray:
+        """Current states of all boats, shape (N, 8)."""
+        return self._states.copy()
+
+    def reset(self, states: np.ndarray) -> None:
+        """Overwrites the states of all boats, shape (N, 8)."""
+        self._states[:] = states
+        self._broadcast("reset")
+
+    def step(self, controls: np.ndarray, adaptation_derivatives: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Advances every boat by one Euler step in parallel.
+
+        Args:
+            controls: Control inputs, shape (N, 2)
+            adaptation_derivatives: Adaptation parameter derivatives, shape (N, 2)
+            dt: Time step
+
+        Returns:
+            np.ndarray: States after the step, shape (N, 8)
+        """
+        self._controls[:] = controls
+        self._adaptation[:] = adaptation_derivatives
+        self._broadcast("step", dt)
+        return self.states
+
+    def close(self) -> None:
+        """Stops the workers and releases the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._conns:
+            try:
+                conn.send(("close", 0.0))
+            except (BrokenPipeError, OSError):
+                pass  # worker already exited after an error
+            conn.close()
+        for proc in self._procs:
+            proc.join()
+        del self._states, self._controls, self._adaptation
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> 'VectorizedBoatSim':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,5 +1,6 @@
 from enum import Enum
 from abc import ABC, abstractmethod
+import math
 import numpy as np
 from noise import pnoise2
 import matplotlib.pyplot as plt
@@ -23,6 +24,19 @@ class IWindField(ABC):
         """
         pass
 
+    def get_wind_batch(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Returns the wind vectors at a batch of coordinates.
+        Default implementation queries get_wind point by point.
+
+        Parameters:
+        - coords: array of shape (N, 2) with (x, y) coordinates
+
+        Returns:
+        - array of shape (N, 2) with (wind_x, wind_y) components
+        """
+        return np.array([self.get_wind(c) for c in coords], dtype=np.float64).reshape(-1, 2)
+
     def plot_wind_field(self, x_range=(-50, 50), y_range=(-50, 50), grid_step=5, size_mult=1, ax=None, alpha=0.5):
         """
         Default plot method for wind field visualization.
@@ -45,14 +59,10 @@ class IWindField(ABC):
         y = np.arange(y_range[0], y_range[1], grid_step)
         X, Y = np.meshgrid(x, y)
         
-        # Calculate wind vectors
-        U = np.zeros_like(X)
-        V = np.zeros_like(Y)
-        for i in range(X.shape[0]):
-            for j in range(X.shape[1]):
-                wind = self.get_wind((X[i,j], Y[i,j]))
-                U[i,j] = wind[0] * size_mult
-                V[i,j] = wind[1] * size_mult
+        # Calculate wind vectors in one batched query
+        wind = self.get_wind_batch(np.column_stack([X.ravel(), Y.ravel()]))
+        U = wind[:, 0].reshape(X.shape) * size_mult
+        V = wind[:, 1].reshape(Y.shape) * size_mult
         
         # Plot quiver
         ax.quiver(X, Y, U, V, scale=20, scale_units='inches', angles='xy', color='blue', width=0.002, alpha=alpha, label="Wind Field")
@@ -141,6 +151,7 @@ class CosineWaveWind(IWindField):
         
         # Precompute direction vector
         self.dir_vector = np.array([np.cos(self.direction_rad), np.sin(self.direction_rad)])
+        self._dir_x, self._dir_y = self.dir_vector.tolist()  # scalar copies for the per-point query
     
     def get_wind(self, coords):
         """
@@ -154,16 +165,21 @@ class CosineWaveWind(IWindField):
         """
         x, y = coords
         
-        # Calculate position along perpendicular axis
-        perp_distance = np.dot([x, y], self.dir_vector)
+        # Calculate position along perpendicular axis (scalar math avoids np dispatch per point)
+        perp_distance = x * self._dir_x + y * self._dir_y
         
         # Calculate speed modulation using cosine function
-        speed_mod = 1 + self.amplitude * np.cos(2 * np.pi * perp_distance / self.wavelength)
+        speed_mod = 1 + self.amplitude * math.cos(2 * math.pi * perp_distance / self.wavelength)
         current_speed = self.base_speed * speed_mod
         
         # Return wind vector in primary direction
-        wind_vector = current_speed * self.dir_vector
-        return (wind_vector[0], wind_vector[1])
+        return (current_speed * self._dir_x, current_speed * self._dir_y)
+
+    def get_wind_batch(self, coords: np.ndarray) -> np.ndarray:
+        """Vectorized get_wind for an (N, 2) array of coordinates, returns (N, 2)."""
+        perp_distance = np.asarray(coords) @ self.dir_vector
+        speed_mod = 1 + self.amplitude * np.cos(2 * np.pi * perp_distance / self.wavelength)
+        return np.outer(self.base_speed * speed_mod, self.dir_vector)
 
     def plot_wind_field(self, x_range=(-10, 10), y_range=(-10, 10), grid_step=1, size_mult=70, ax=None, alpha=0.5):
         super().plot_wind_field(x_range=x_range, y_range=y_range, grid_step=grid_step, size_mult=size_mult, ax=ax, alpha=alpha)
@@ -177,6 +193,12 @@ class ConstantWind(IWindField):
     def get_wind(self, coords):
         return self.vector
 
+    def get_wind_batch(self, coords: np.ndarray) -> np.ndarray:
+        """Same vector for every point of an (N, 2) array of coordinates, returns (N, 2)."""
+        wind = np.empty((len(coords), 2))
+        wind[:] = self.vector
+        return wind
+
     def plot_wind_field(self, x_range=(-10, 10), y_range=(-10, 10), grid_step=1, size_mult=70, ax=None, alpha=0.5):
         super().plot_wind_field(x_range=x_range, y_range=y_range, grid_step=grid_step, size_mult=size_mult, ax=ax, alpha=alpha)
 
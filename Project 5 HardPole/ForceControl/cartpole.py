@@ -1,7 +1,8 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from numba import njit, prange
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CartPoleParams:
     m_cart: float = 1.0      # mass of the cart
     m_pole: float = 0.1      # mass of the pole
@@ -11,68 +12,159 @@ class CartPoleParams:
     rotary_damping: float = 0.1  # pole angular damping
     max_force: float = 300.0
 
+    # Derived invariants, computed once at init; the class is frozen so they cannot go stale
+    # (use dataclasses.replace to change a parameter)
+    total_mass: float = field(init=False, repr=False)
+    pole_mass_length: float = field(init=False, repr=False)
+    inv_total_mass: float = field(init=False, repr=False)
+    four_thirds_l: float = field(init=False, repr=False)
+    _dynamics_tuples: dict = field(init=False, repr=False, compare=False)  # dtype -> dynamics_tuple
+
+    def __post_init__(self):
+        total_mass = self.m_cart + self.m_pole
+        object.__setattr__(self, "total_mass", total_mass)
+        object.__setattr__(self, "pole_mass_length", self.m_pole * self.l)
+        object.__setattr__(self, "inv_total_mass", 1.0 / total_mass)
+        object.__setattr__(self, "four_thirds_l", 4 / 3 * self.l)
+        object.__setattr__(self, "_dynamics_tuples", {})
+
+    def dynamics_tuple(self, dtype=np.float64) -> tuple:
+        """
+        Parameters in the order expected by the jitted dynamics, built once per dtype.
+        dtype should match the state arrays, so float32 batches are not upcast by float64 constants.
+        """
+        params = self._dynamics_tuples.get(dtype)
+        if params is None:
+            params = tuple(dtype(v) for v in (self.g, self.damping, self.rotary_damping,
+                                              self.pole_mass_length, self.inv_total_mass, self.four_thirds_l))
+            self._dynamics_tuples[dtype] = params
+        return params
+
+
+def _normalize_angle(angle: float) -> float:
+    """Wraps any angle to [-π, π) with a modulo, for values that may be several turns out of range."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+@njit(cache=True, fastmath=True)
+def cartpole_dynamics(g, damping, rotary_damping, pole_mass_length, inv_total_mass, four_thirds_l,
+                      x, x_dot, theta, theta_dot, force):
+    """Jitted scalar dynamics, returns (x_dot, x_ddot, theta_dot, theta_ddot)."""
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+
+    temp = (force + pole_mass_length * theta_dot * theta_dot * sin_theta - damping * x_dot) * inv_total_mass
+
+    # l * (4/3 - m_pole * cos² / total_mass), expanded so no float64 literal enters float32 batches
+    theta_acc = (g * sin_theta - cos_theta * temp - rotary_damping * theta_dot) / \
+                (four_thirds_l - pole_mass_length * cos_theta * cos_theta * inv_total_mass)
+
+    x_acc = temp - pole_mass_length * theta_acc * cos_theta * inv_total_mass
+
+    return x_dot, x_acc, theta_dot, theta_acc
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def cartpole_dynamics_batch(params_tuple, states, forces, out):
+    """Jitted batch dynamics over all cores, writes (N, 4) derivatives into out."""
+    g, damping, rotary_damping, pole_mass_length, inv_total_mass, four_thirds_l = params_tuple
+    for i in prange(states.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2], out[i, 3] = cartpole_dynamics(
+            g, damping, rotary_damping, pole_mass_length, inv_total_mass, four_thirds_l,
+            states[i, 0], states[i, 1], states[i, 2], states[i, 3], forces[i])
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def simulate_cartpole(state, force_seq, dt, g, damping, rotary_damping, pole_mass_length, inv_total_mass, four_thirds_l,
+                      max_force):
+    """
+    Jitted Euler rollout matching repeated CartPole.update calls.
+    state: shape (4,) with theta ∈ [-π, π], force_seq: shape (T,)
+    Returns: trajectory of states after each step, shape (T, 4)
+    """
+    T = force_seq.shape[0]
+    traj = np.empty((T, 4), dtype=state.dtype)
+    x, x_dot, theta, theta_dot = state[0], state[1], state[2], state[3]
+    for t in range(T):
+        force = min(max(force_seq[t], -max_force), max_force)
+        d_x, d_x_dot, d_theta, d_theta_dot = cartpole_dynamics(
+            g, damping, rotary_damping, pole_mass_length, inv_total_mass, four_thirds_l, x, x_dot, theta, theta_dot, force)
+        x += d_x * dt
+        x_dot += d_x_dot * dt
+        theta += d_theta * dt
+        theta_dot += d_theta_dot * dt
+        # wrap theta ∈ [-π, π], one Euler step never moves it by a full turn
+        if theta > np.pi:
+            theta -= 2 * np.pi
+        elif theta < -np.pi:
+            theta += 2 * np.pi
+        traj[t, 0] = x
+        traj[t, 1] = x_dot
+        traj[t, 2] = theta
+        traj[t, 3] = theta_dot
+    return traj
+
+
 class CartPole:
-    def __init__(self, init_state: np.ndarray, params: CartPoleParams = None):
-        self.state = init_state.astype(np.float64)
+    def __init__(self, init_state: np.ndarray, params: CartPoleParams = None, dtype=np.float64):
+        """
+        dtype: state precision; np.float32 halves memory traffic for large rollouts,
+               np.float64 (default) keeps the reference behaviour for regression testing.
+        """
+        self.state = init_state.astype(dtype)
+        # theta is normalized once here, so the per-step wrap only has to undo single-step overshoots
+        self.state[2] = _normalize_angle(self.state[2])
         self.params = params if params else CartPoleParams()
+        self._d = np.empty(4, dtype=dtype)  # derivative buffer reused by update
 
     @staticmethod
-    def dynamics(params: CartPoleParams, state: np.ndarray, force: float) -> np.ndarray:
+    def dynamics(params: CartPoleParams, state: np.ndarray, force: float, out: np.ndarray = None) -> np.ndarray:
         """
         State-space form:
             state = [x, x_dot, theta, theta_dot]
             state_dot = [x_dot, x_ddot, theta_dot, theta_ddot]
+        out: optional preallocated buffer of shape (4,) for state_dot
         """
-        x, x_dot, theta, theta_dot = state
-        p = params
-
-        sin_theta = np.sin(theta)
-        cos_theta = np.cos(theta)
-
-        total_mass = p.m_cart + p.m_pole
-        pole_mass_length = p.m_pole * p.l
-
-        temp = (force + pole_mass_length * theta_dot**2 * sin_theta - p.damping * x_dot) / total_mass
-
-        theta_acc = (p.g * sin_theta - cos_theta * temp - p.rotary_damping * theta_dot) / \
-                    (p.l * (4/3 - p.m_pole * cos_theta**2 / total_mass))
-
-        x_acc = temp - pole_mass_length * theta_acc * cos_theta / total_mass
-
-        return np.array([x_dot, x_acc, theta_dot, theta_acc])
+        if out is None:
+            out = np.empty(4)
+        out[0], out[1], out[2], out[3] = cartpole_dynamics(
+            *params.dynamics_tuple(), state[0], state[1], state[2], state[3], float(force))
+        return out
     
     @staticmethod
-    def dynamics_batch(params: CartPoleParams, states: np.ndarray, forces: np.ndarray) -> np.ndarray:
+    def dynamics_batch(params: CartPoleParams, states: np.ndarray, forces: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
         Vectorized dynamics for a batch of states and forces.
         states: shape (N, 4)
         forces: shape (N,)
+        out: optional preallocated buffer of shape (N, 4), e.g. reused across rollout steps
         Returns: shape (N, 4)
         """
-        x = states[:, 0]
-        x_dot = states[:, 1]
-        theta = states[:, 2]
-        theta_dot = states[:, 3]
-        p = params
-
-        sin_theta = np.sin(theta)
-        cos_theta = np.cos(theta)
-
-        total_mass = p.m_cart + p.m_pole
-        pole_mass_length = p.m_pole * p.l
-
-        temp = (forces + pole_mass_length * theta_dot**2 * sin_theta - p.damping * x_dot) / total_mass
-
-        theta_acc = (p.g * sin_theta - cos_theta * temp - p.rotary_damping * theta_dot) / \
-                    (p.l * (4/3 - p.m_pole * cos_theta**2 / total_mass))
-
-        x_acc = temp - pole_mass_length * theta_acc * cos_theta / total_mass
-
-        derivs = np.stack([x_dot, x_acc, theta_dot, theta_acc], axis=-1)
-        return derivs
+        if out is None:
+            out = np.empty_like(states)
+        return cartpole_dynamics_batch(params.dynamics_tuple(out.dtype.type), states, forces, out)
 
     def update(self, force: float, dt: float):
-        force = np.clip(force, -self.params.max_force, self.params.max_force)
-        derivs = self.dynamics(self.params, self.state, force)
+        mx = self.params.max_force
+        force = mx if force > mx else (-mx if force < -mx else force)  # scalar clip without ufunc dispatch
+        derivs = self.dynamics(self.params, self.state, force, self._d)
         self.state += derivs * dt
-        self.state[2] = (self.state[2] + np.pi) % (2 * np.pi) - np.pi  # wrap theta ∈ [-π, π]
+        # wrap theta ∈ [-π, π], one Euler step never moves it by a full turn
+        theta = self.state[2]
+        if theta > np.pi:
+            self.state[2] = theta - 2 * np.pi
+        elif theta < -np.pi:
+            self.state[2] = theta + 2 * np.pi
+
+    def simulate(self, forces: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Applies a whole force sequence in one jitted loop, equivalent to calling update for each force.
+        forces: shape (T,)
+        Returns: trajectory of states after each step, shape (T, 4)
+        """
+        traj = simulate_cartpole(self.state, np.asarray(forces, dtype=np.float64), dt,
+                                 *self.params.dynamics_tuple(), float(self.params.max_force))
+        if len(traj):
+            self.state[:] = traj[-1]
+        return traj
@@ -0,0 +1,82 @@
+"""
+JAX port of the cart-pole dynamics for jit-compiled, vmapped rollouts (CPU/GPU/TPU).
+
+State layout matches CartPole.state: [x, x_dot, theta, theta_dot].
+JAX computes in float32 unless `jax.config.update("jax_enable_x64", True)` is set.
+"""
+from typing import NamedTuple
+import jax
+import jax.numpy as jnp
+from cartpole import CartPoleParams
+
+
+class CartPoleParamsJax(NamedTuple):
+    """CartPoleParams as a JAX pytree."""
+    m_cart: float
+    m_pole: float
+    l: float
+    g: float
+    damping: float
+    rotary_damping: float
+    max_force: float
+
+    @classmethod
+    def from_params(cls, p: CartPoleParams) -> 'CartPoleParamsJax':
+        return cls(p.m_cart, p.m_pole, p.l, p.g, p.damping, p.rotary_damping, p.max_force)
+
+
+@jax.jit
+def dynamics(params: CartPoleParamsJax, state: jnp.ndarray, force: float) -> jnp.ndarray:
+    """
+    State-space form:
+        state = [x, x_dot, theta, theta_dot]
+        state_dot = [x_dot, x_ddot, theta_dot, theta_ddot]
+    """
+    _, x_dot, theta, theta_dot = state
+    p = params
+
+    sin_theta = jnp.sin(theta)
+    cos_theta = jnp.cos(theta)
+
+    total_mass = p.m_cart + p.m_pole
+    pole_mass_length = p.m_pole * p.l
+
+    temp = (force + pole_mass_length * theta_dot * theta_dot * sin_theta - p.damping * x_dot) / total_mass
+
+    theta_acc = (p.g * sin_theta - cos_theta * temp - p.rotary_damping * theta_dot) / \
+                (p.l * (4/3 - p.m_pole * cos_theta * cos_theta / total_mass))
+
+    x_acc = temp - pole_mass_length * theta_acc * cos_theta / total_mass
+
+    return jnp.stack([x_dot, x_acc, theta_dot, theta_acc])
+
+
+@jax.jit
+def step(params: CartPoleParamsJax, state: jnp.ndarray, force: float, dt: float) -> jnp.ndarray:
+    """Euler step matching CartPole.update."""
+    force = jnp.clip(force, -params.max_force, params.max_force)
+    state = state + dynamics(params, state, force) * dt
+    return state.at[2].set((state[2] + jnp.pi) % (2 * jnp.pi) - jnp.pi)  # wrap theta ∈ [-π, π]
+
+
+# Batched versions: states (N, 4), forces (N,)
+dynamics_batch = jax.jit(jax.vmap(dynamics, in_axes=(None, 0, 0)))
+step_batch = jax.jit(jax.vmap(step, in_axes=(None, 0, 0, None)))
+
+
+@jax.jit
+def rollout(params: CartPoleParamsJax, state: jnp.ndarray, forces: jnp.ndarray, dt: float) -> jnp.ndarray:
+    """
+    Simulates a whole episode with jax.lax.scan.
+    state: shape (4,), forces: shape (T,)
+    Returns: trajectory of states after each step, shape (T, 4)
+    """
+    def body(carry, force):
+        new_state = step(params, carry, force, dt)
+        return new_state, new_state
+    _, trajectory = jax.lax.scan(body, state, forces)
+    return trajectory
+
+
+# Batched episodes: states (N, 4), forces (N, T) -> trajectories (N, T, 4)
+rollout_batch = jax.jit(jax.vmap(rollout, in_axes=(None, 0, 0, None)))
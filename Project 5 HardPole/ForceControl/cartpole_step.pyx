@@ -0,0 +1,81 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython version of the cart-pole step, for deployments without numba's import and compile cost.
+
+Build in place with:
+    python setup_cartpole_step.py build_ext --inplace
+
+`cartpole_dynamics` has the same signature as cartpole.cartpole_dynamics.
+"""
+from libc.math cimport sin, cos, M_PI
+
+ctypedef struct CartPoleParamsC:
+    double g
+    double damping
+    double rotary_damping
+    double pole_mass_length
+    double inv_total_mass
+    double four_thirds_l
+    double max_force
+
+
+cdef inline void dynamics_c(const CartPoleParamsC* p, const double* s, double force, double* out) noexcept nogil:
+    """Writes [x_dot, x_ddot, theta_dot, theta_ddot] into out."""
+    cdef double x_dot = s[1], theta_dot = s[3]
+    cdef double sin_theta = sin(s[2])
+    cdef double cos_theta = cos(s[2])
+
+    cdef double temp = (force + p.pole_mass_length * theta_dot * theta_dot * sin_theta - p.damping * x_dot) * p.inv_total_mass
+    cdef double theta_acc = (p.g * sin_theta - cos_theta * temp - p.rotary_damping * theta_dot) / \
+                            (p.four_thirds_l - p.pole_mass_length * cos_theta * cos_theta * p.inv_total_mass)
+
+    out[0] = x_dot
+    out[1] = temp - p.pole_mass_length * theta_acc * cos_theta * p.inv_total_mass
+    out[2] = theta_dot
+    out[3] = theta_acc
+
+
+cdef inline void step_c(const CartPoleParamsC* p, double* s, double force, double dt) noexcept nogil:
+    """In-place Euler step matching CartPole.update."""
+    cdef double d[4]
+    cdef int i
+    force = p.max_force if force > p.max_force else (-p.max_force if force < -p.max_force else force)
+    dynamics_c(p, s, force, d)
+    for i in range(4):
+        s[i] += d[i] * dt
+    # wrap theta ∈ [-π, π], one Euler step never moves it by a full turn
+    if s[2] > M_PI:
+        s[2] -= 2 * M_PI
+    elif s[2] < -M_PI:
+        s[2] += 2 * M_PI
+
+
+cdef CartPoleParamsC _params_c(params):
+    cdef CartPoleParamsC p
+    p.g, p.damping, p.rotary_damping, p.pole_mass_length, p.inv_total_mass, p.four_thirds_l = params.dynamics_tuple()
+    p.max_force = params.max_force
+    return p
+
+
+def cartpole_dynamics(double g, double damping, double rotary_damping,
+                      double pole_mass_length, double inv_total_mass, double four_thirds_l,
+                      double x, double x_dot, double theta, double theta_dot, double force):
+    """Drop-in replacement for cartpole.cartpole_dynamics, returns (x_dot, x_ddot, theta_dot, theta_ddot)."""
+    cdef CartPoleParamsC p
+    cdef double s[4]
+    cdef double out[4]
+    p.g, p.damping, p.rotary_damping = g, damping, rotary_damping
+    p.pole_mass_length, p.inv_total_mass, p.four_thirds_l = pole_mass_length, inv_total_mass, four_thirds_l
+    s[0], s[1], s[2], s[3] = x, x_dot, theta, theta_dot
+    dynamics_c(&p, s, force, out)
+    return out[0], out[1], out[2], out[3]
+
+
+def cartpole_step(double[::1] state, double force, double dt, params):
+    """
+    Advances CartPole.state in place by one step, equivalent to CartPole.update.
+    state: float64 array of shape (4,) with theta ∈ [-π, π], as CartPole.state is
+    """
+    cdef CartPoleParamsC p = _params_c(params)
+    with nogil:
+        step_c(&p, &state[0], force, dt)
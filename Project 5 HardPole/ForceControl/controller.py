@@ -36,6 +36,8 @@ class ControlParams:
         weight_x: float = 1.0
         weight_x_dot: float = 0.1
 
+        dtype: type = np.float32 # rollout precision, np.float64 to compare against the exact model
+
     pd: PDParams
     energy: EnergyParams
     hybrid: HybridParams
@@ -144,16 +146,17 @@ class Controller:
         rng  = np.random.default_rng()
 
         # allocate once
-        states = np.repeat(state[None, :], N, axis=0)   # (N,4)
-        u0     = rng.normal(0, m_f / 2, N)              # initial force, normal distribution
+        states = np.repeat(state[None, :], N, axis=0).astype(p.dtype)   # (N,4)
+        u0     = rng.normal(0, m_f / 2, N).astype(p.dtype)              # initial force, normal distribution
         u      = u0.copy()
 
         # all random Δu for the entire horizon except the first step
-        du_all = rng.normal(0, fspd / 2, (N, H-1))
+        du_all = rng.normal(0, fspd / 2, (N, H-1)).astype(p.dtype)
+        vel    = np.empty_like(states)                  # derivative buffer reused over the horizon
 
         for k in range(H):
             # apply control
-            vel   = CartPole.dynamics_batch(self.cartpole_params, states, u)
+            CartPole.dynamics_batch(self.cartpole_params, states, u, out=vel)
             states += dt * vel
             states[:, 2] = (states[:, 2] + np.pi) % (2*np.pi) - np.pi  # wrap θ
             states[np.abs(states[:, 0]) > p.x_limit][:,0] = np.inf  # ruine the pose
@@ -0,0 +1,8 @@
+"""Builds the optional Cython cart-pole step module: python setup_cartpole_step.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="cartpole_step",
+    ext_modules=cythonize("cartpole_step.pyx", language_level=3, annotate=True),
+)